@@ -17,8 +17,13 @@ class Node:
     Attributes:
         data: The data stored in the node
         next: Reference to the next node in the list
+        hop: Used only while sorting: reference to the last node of the
+            run of equal values this node starts (None for a run of length
+            one, and always None outside of sort)
     """
     
+    __slots__ = ('data', 'next', 'hop')
+    
     def __init__(self, data):
         """
         Initialize a new node.
@@ -28,12 +33,121 @@ class Node:
         """
         self.data = data
         self.next = None
+        self.hop = None
     
     def __repr__(self):
         """String representation of the node."""
         return f"Node({self.data})"
 
 
+def _merge(a, b):
+    """
+    Merge two sorted chains of nodes by relinking their next pointers.
+    
+    Both chains are grouped into runs of equal values whose first node's
+    ``hop`` points at the run's last node (None when the run is just that
+    node). Whole runs are moved with a single
+    comparison, and when both heads are equal the run from ``b`` is spliced
+    behind the run from ``a`` so the two collapse into one run. Nodes from
+    ``a`` come before equal nodes from ``b``, which keeps the merge stable.
+    
+    Args:
+        a: Head of the first sorted chain (may be None)
+        b: Head of the second sorted chain (may be None)
+        
+    Returns:
+        Node: Head of the merged chain
+    """
+    dummy = Node(None)
+    tail = dummy
+    
+    while a is not None and b is not None:
+        if b.data < a.data:
+            tail.next = b
+            tail = b.hop or b
+            b = tail.next
+        elif a.data < b.data:
+            tail.next = a
+            tail = a.hop or a
+            a = tail.next
+        else:
+            # Equal runs: append b's run to a's and skip both at once
+            a_last = a.hop or a
+            b_last = b.hop or b
+            next_a = a_last.next
+            next_b = b_last.next
+            a_last.next = b
+            a.hop = b_last
+            tail.next = a
+            tail = b_last
+            a = next_a
+            b = next_b
+    
+    tail.next = a if a is not None else b
+    return dummy.next
+
+
+def _mergesort(head):
+    """
+    Sort a chain of nodes with bottom-up merge sort.
+    
+    A first pass cuts the chain into its natural non-descending runs and
+    links equal neighbours together through ``hop``, so already sorted or
+    repetitive data needs far fewer merges and comparisons. Each run is then
+    pushed onto a stack; the number of trailing one bits in the run counter
+    tells how many times the new run has to be merged with the top of the
+    stack. All ``hop`` pointers are cleared again before returning, so no
+    node keeps a reference to another one outside of ``next``.
+    
+    Args:
+        head: Head of the chain to sort (not empty)
+        
+    Returns:
+        tuple: (head, tail) of the sorted chain
+    """
+    stack = []
+    count = 0
+    
+    while head is not None:
+        run = head
+        group = head
+        group.hop = None
+        current = head
+        head = head.next
+        
+        # Extend the run while values do not descend
+        while head is not None and not head.data < current.data:
+            if current.data < head.data:
+                group = head
+                group.hop = None
+            else:
+                group.hop = head
+            current = head
+            head = head.next
+        current.next = None
+        
+        bits = count
+        while bits & 1:
+            run = _merge(stack.pop(), run)
+            bits >>= 1
+        stack.append(run)
+        count += 1
+    
+    # Drain the stack, merging older (earlier) runs in front of newer ones
+    run = stack.pop() if stack else None
+    while stack:
+        run = _merge(stack.pop(), run)
+    
+    # Clear the hop pointers and find the new tail in one walk
+    current = run
+    current.hop = None
+    while current.next is not None:
+        current = current.next
+        current.hop = None
+    
+    return run, current
+
+
 class LinkedList:
     """
     A singly linked list implementation.
@@ -42,15 +156,19 @@ class LinkedList:
     insertion, deletion, searching, and traversal.
     """
     
+    __slots__ = ('head', 'tail', 'size')
+    
     def __init__(self):
         """
         Initialize an empty linked list.
         
         Attributes:
             head: Reference to the first node in the list
+            tail: Reference to the last node in the list
             size: Number of nodes in the list
         """
         self.head = None
+        self.tail = None
         self.size = 0
     
     def is_empty(self):
@@ -84,13 +202,17 @@ class LinkedList:
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        
+        if self.tail is None:
+            self.tail = new_node
+        
         self.size += 1
     
     def insert_at_end(self, data):
         """
         Insert a new node at the end of the linked list.
         
-        Time Complexity: O(n)
+        Time Complexity: O(1)
         Space Complexity: O(1)
         
         Args:
@@ -101,11 +223,9 @@ class LinkedList:
         if self.is_empty():
             self.head = new_node
         else:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
         
+        self.tail = new_node
         self.size += 1
     
     def insert_at_position(self, data, position):
@@ -129,6 +249,10 @@ class LinkedList:
             self.insert_at_beginning(data)
             return
         
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        
         new_node = Node(data)
         current = self.head
         
@@ -159,12 +283,16 @@ class LinkedList:
         # If the node to delete is the head
         if self.head.data == data:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self.size -= 1
             return True
         
         current = self.head
         while current.next is not None:
             if current.next.data == data:
+                if current.next is self.tail:
+                    self.tail = current
                 current.next = current.next.next
                 self.size -= 1
                 return True
@@ -194,6 +322,8 @@ class LinkedList:
         if position == 0:
             data = self.head.data
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self.size -= 1
             return data
         
@@ -202,6 +332,8 @@ class LinkedList:
             current = current.next
         
         data = current.next.data
+        if current.next is self.tail:
+            self.tail = current
         current.next = current.next.next
         self.size -= 1
         return data
@@ -219,14 +351,9 @@ class LinkedList:
         Returns:
             int: The position of the node (0-indexed), -1 if not found
         """
-        current = self.head
-        position = 0
-        
-        while current is not None:
-            if current.data == data:
+        for position, value in enumerate(self):
+            if value == data:
                 return position
-            current = current.next
-            position += 1
         
         return -1
     
@@ -266,14 +393,7 @@ class LinkedList:
             print("List is empty")
             return
         
-        elements = []
-        current = self.head
-        
-        while current is not None:
-            elements.append(str(current.data))
-            current = current.next
-        
-        print(" -> ".join(elements) + " -> None")
+        print(" -> ".join(map(str, self)) + " -> None")
     
     def reverse(self):
         """
@@ -287,6 +407,7 @@ class LinkedList:
         
         previous = None
         current = self.head
+        self.tail = current
         
         while current is not None:
             next_node = current.next
@@ -298,31 +419,81 @@ class LinkedList:
     
     def sort(self):
         """
-        Sort the linked list using bubble sort.
+        Sort the linked list using bottom-up hop-pointer merge sort.
         
-        Time Complexity: O(n²)
-        Space Complexity: O(1)
+        Nodes are relinked rather than having their data swapped, so no
+        values are copied and the sort is stable. Runs of equal values are
+        merged as a unit, so lists with many repeated or presorted values
+        sort faster than the worst case.
+        
+        Time Complexity: O(n log n)
+        Space Complexity: O(log n)
         """
         if self.is_empty() or self.head.next is None:
             return
         
-        swapped = True
-        while swapped:
-            swapped = False
-            current = self.head
-            
-            while current.next is not None:
-                if current.data > current.next.data:
-                    # Swap data
-                    current.data, current.next.data = current.next.data, current.data
-                    swapped = True
-                current = current.next
+        self.head, self.tail = _mergesort(self.head)
     
     def remove_duplicates(self):
         """
-        Remove duplicate elements from the linked list.
+        Remove duplicate elements, keeping the first occurrence of each value.
+        
+        Values already seen are tracked in a set. Unhashable data falls back
+        to comparing every node against the nodes after it.
+        
+        Time Complexity: O(n) (O(n²) for unhashable data)
+        Space Complexity: O(u) where u is the number of unique elements
+        """
+        if self.is_empty() or self.head.next is None:
+            return
+        
+        try:
+            self._remove_duplicates_hashed()
+        except TypeError:
+            # Only true duplicates were removed so far, so the scan can
+            # finish the job from the current state
+            self._remove_duplicates_scan()
+    
+    def _remove_duplicates_hashed(self):
+        """Remove duplicates in one pass using a set of seen values."""
+        seen = set()
+        previous = None
+        current = self.head
+        
+        while current is not None:
+            if current.data in seen:
+                previous.next = current.next
+                self.size -= 1
+                current = previous.next
+            else:
+                seen.add(current.data)
+                previous = current
+                current = current.next
+        
+        self.tail = previous
+    
+    def _remove_duplicates_scan(self):
+        """Remove duplicates by scanning ahead of every node."""
+        current = self.head
         
-        Time Complexity: O(n²)
+        while current is not None:
+            runner = current
+            while runner.next is not None:
+                if runner.next.data == current.data:
+                    runner.next = runner.next.next
+                    self.size -= 1
+                else:
+                    runner = runner.next
+            
+            self.tail = current
+            current = current.next
+    
+    def collapse_runs(self):
+        """
+        Remove adjacent duplicate elements, collapsing each run of equal
+        values into a single node.
+        
+        Time Complexity: O(n)
         Space Complexity: O(1)
         """
         if self.is_empty() or self.head.next is None:
@@ -335,6 +506,8 @@ class LinkedList:
                 self.size -= 1
             else:
                 current = current.next
+        
+        self.tail = current
     
     def find_middle(self):
         """
@@ -393,14 +566,14 @@ class LinkedList:
         Returns:
             list: A list containing all elements
         """
-        result = []
+        return list(self)
+    
+    def __iter__(self):
+        """Iterate over the data stored in the linked list, head first."""
         current = self.head
-        
         while current is not None:
-            result.append(current.data)
+            yield current.data
             current = current.next
-        
-        return result
     
     def __len__(self):
         """Return the size of the linked list."""
@@ -408,14 +581,484 @@ class LinkedList:
     
     def __str__(self):
         """String representation of the linked list."""
+        return f"LinkedList({list(self)})"
+    
+    def __repr__(self):
+        """Detailed string representation of the linked list."""
+        return self.__str__()
+
+
+CHUNK_SIZE = 64
+
+
+class _Chunk:
+    """
+    A fixed-size block of slots in an unrolled linked list.
+    
+    Attributes:
+        data: Preallocated list of CHUNK_SIZE slots, the first count in use
+        count: Number of slots in use
+        next: Reference to the next chunk in the list
+    """
+    
+    __slots__ = ('data', 'count', 'next')
+    
+    def __init__(self):
+        """Initialize an empty chunk."""
+        self.data = [None] * CHUNK_SIZE
+        self.count = 0
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    An unrolled linked list implementation.
+    
+    Elements are stored in chunks of up to CHUNK_SIZE slots, so a traversal
+    mostly steps through a contiguous Python list and only follows a pointer
+    once per chunk. This is far friendlier to the CPU cache than chasing one
+    separately allocated Node per element. It supports the same operations as
+    LinkedList, except detect_loop since chunks are never exposed to callers.
+    """
+    
+    def __init__(self):
+        """
+        Initialize an empty unrolled linked list.
+        
+        Attributes:
+            head_chunk: Reference to the first chunk in the list
+            tail_chunk: Reference to the last chunk in the list
+            size: Number of elements in the list
+        """
+        self.head_chunk = None
+        self.tail_chunk = None
+        self.size = 0
+    
+    def is_empty(self):
+        """
+        Check if the list is empty.
+        
+        Returns:
+            bool: True if the list is empty, False otherwise
+        """
+        return self.size == 0
+    
+    def get_size(self):
+        """
+        Get the number of elements in the list.
+        
+        Returns:
+            int: The size of the list
+        """
+        return self.size
+    
+    def _locate(self, position):
+        """
+        Find the chunk holding an in-range position.
+        
+        Args:
+            position: The position to look up (0-indexed)
+            
+        Returns:
+            tuple: (previous chunk, chunk, index within chunk)
+        """
+        previous = None
+        chunk = self.head_chunk
+        
+        while position >= chunk.count:
+            position -= chunk.count
+            previous = chunk
+            chunk = chunk.next
+        
+        return previous, chunk, position
+    
+    def _find(self, data):
+        """
+        Find the first element equal to the given data.
+        
+        Args:
+            data: The data to search for
+            
+        Returns:
+            tuple: (previous chunk, chunk, index within chunk, position),
+            or None if not found
+        """
+        previous = None
+        chunk = self.head_chunk
+        position = 0
+        
+        while chunk is not None:
+            try:
+                index = chunk.data.index(data, 0, chunk.count)
+            except ValueError:
+                position += chunk.count
+                previous = chunk
+                chunk = chunk.next
+            else:
+                return previous, chunk, index, position + index
+        
+        return None
+    
+    def _remove_at(self, previous, chunk, index):
+        """
+        Remove a slot from a chunk, unlinking the chunk if it becomes empty.
+        
+        Args:
+            previous: The chunk before chunk (None if chunk is the head)
+            chunk: The chunk to remove from
+            index: The index within chunk to remove
+            
+        Returns:
+            The removed data
+        """
+        slots = chunk.data
+        count = chunk.count
+        data = slots[index]
+        
+        # Shift the rest of the chunk down by one
+        slots[index:count - 1] = slots[index + 1:count]
+        slots[count - 1] = None
+        chunk.count = count - 1
+        
+        if chunk.count == 0:
+            if previous is None:
+                self.head_chunk = chunk.next
+            else:
+                previous.next = chunk.next
+            if chunk is self.tail_chunk:
+                self.tail_chunk = previous
+        
+        self.size -= 1
+        return data
+    
+    def _rebuild(self, values):
+        """
+        Replace the contents of the list with values packed into full chunks.
+        
+        Args:
+            values: A Python list of the new elements
+        """
+        self.head_chunk = None
+        self.tail_chunk = None
+        
+        for start in range(0, len(values), CHUNK_SIZE):
+            chunk = _Chunk()
+            part = values[start:start + CHUNK_SIZE]
+            chunk.data[:len(part)] = part
+            chunk.count = len(part)
+            
+            if self.tail_chunk is None:
+                self.head_chunk = chunk
+            else:
+                self.tail_chunk.next = chunk
+            self.tail_chunk = chunk
+        
+        self.size = len(values)
+    
+    def insert_at_beginning(self, data):
+        """
+        Insert a new element at the beginning of the list.
+        
+        Time Complexity: O(CHUNK_SIZE)
+        Space Complexity: O(1)
+        
+        Args:
+            data: The data to insert
+        """
+        self.insert_at_position(data, 0)
+    
+    def insert_at_end(self, data):
+        """
+        Insert a new element at the end of the list.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        
+        Args:
+            data: The data to insert
+        """
+        chunk = self.tail_chunk
+        
+        if chunk is None or chunk.count == CHUNK_SIZE:
+            new_chunk = _Chunk()
+            if chunk is None:
+                self.head_chunk = new_chunk
+            else:
+                chunk.next = new_chunk
+            self.tail_chunk = chunk = new_chunk
+        
+        chunk.data[chunk.count] = data
+        chunk.count += 1
+        self.size += 1
+    
+    def insert_at_position(self, data, position):
+        """
+        Insert a new element at a specific position in the list.
+        
+        A full chunk is split in half before inserting, otherwise the rest
+        of the chunk is shifted up by one slot.
+        
+        Time Complexity: O(n / CHUNK_SIZE + CHUNK_SIZE)
+        Space Complexity: O(1)
+        
+        Args:
+            data: The data to insert
+            position: The position where to insert (0-indexed)
+            
+        Raises:
+            IndexError: If position is out of range
+        """
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of range")
+        
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+        
+        _, chunk, index = self._locate(position)
+        
+        if chunk.count == CHUNK_SIZE:
+            # Move the upper half of the full chunk into a new chunk
+            half = CHUNK_SIZE // 2
+            new_chunk = _Chunk()
+            new_chunk.data[:CHUNK_SIZE - half] = chunk.data[half:]
+            new_chunk.count = CHUNK_SIZE - half
+            chunk.data[half:] = [None] * (CHUNK_SIZE - half)
+            chunk.count = half
+            
+            new_chunk.next = chunk.next
+            chunk.next = new_chunk
+            if chunk is self.tail_chunk:
+                self.tail_chunk = new_chunk
+            
+            if index > half:
+                chunk = new_chunk
+                index -= half
+        
+        slots = chunk.data
+        count = chunk.count
+        slots[index + 1:count + 1] = slots[index:count]
+        slots[index] = data
+        chunk.count = count + 1
+        self.size += 1
+    
+    def delete_by_value(self, data):
+        """
+        Delete the first occurrence of an element with the given data.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        
+        Args:
+            data: The data to delete
+            
+        Returns:
+            bool: True if the element was deleted, False if not found
+        """
+        found = self._find(data)
+        if found is None:
+            return False
+        
+        previous, chunk, index, _ = found
+        self._remove_at(previous, chunk, index)
+        return True
+    
+    def delete_by_position(self, position):
+        """
+        Delete the element at a specific position.
+        
+        Time Complexity: O(n / CHUNK_SIZE + CHUNK_SIZE)
+        Space Complexity: O(1)
+        
+        Args:
+            position: The position of the element to delete (0-indexed)
+            
+        Returns:
+            The data of the deleted element
+            
+        Raises:
+            IndexError: If position is out of range
+        """
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of range")
+        
+        previous, chunk, index = self._locate(position)
+        return self._remove_at(previous, chunk, index)
+    
+    def search(self, data):
+        """
+        Search for an element with the given data.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        
+        Args:
+            data: The data to search for
+            
+        Returns:
+            int: The position of the element (0-indexed), -1 if not found
+        """
+        found = self._find(data)
+        return -1 if found is None else found[3]
+    
+    def get_element_at_position(self, position):
+        """
+        Get the data at a specific position.
+        
+        Whole chunks are skipped using their counts, so only one pointer is
+        followed per CHUNK_SIZE elements.
+        
+        Time Complexity: O(n / CHUNK_SIZE)
+        Space Complexity: O(1)
+        
+        Args:
+            position: The position to get data from (0-indexed)
+            
+        Returns:
+            The data at the specified position
+            
+        Raises:
+            IndexError: If position is out of range
+        """
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of range")
+        
+        _, chunk, index = self._locate(position)
+        return chunk.data[index]
+    
+    def display(self):
+        """
+        Display all elements in the list.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
         if self.is_empty():
-            return "LinkedList([])"
+            print("List is empty")
+            return
         
-        elements = self.to_list()
-        return f"LinkedList({elements})"
+        print(" -> ".join(map(str, self.to_list())) + " -> None")
+    
+    def reverse(self):
+        """
+        Reverse the list in place by reversing the chunk order and each chunk.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(CHUNK_SIZE)
+        """
+        previous = None
+        chunk = self.head_chunk
+        self.tail_chunk = chunk
+        
+        while chunk is not None:
+            count = chunk.count
+            chunk.data[:count] = chunk.data[count - 1::-1]
+            next_chunk = chunk.next
+            chunk.next = previous
+            previous = chunk
+            chunk = next_chunk
+        
+        self.head_chunk = previous
+    
+    def sort(self):
+        """
+        Sort the list using Python's built-in sort on the gathered slots.
+        
+        Time Complexity: O(n log n)
+        Space Complexity: O(n)
+        """
+        values = self.to_list()
+        values.sort()
+        self._rebuild(values)
+    
+    def remove_duplicates(self):
+        """
+        Remove duplicate elements, keeping the first occurrence of each value.
+        
+        Unhashable data falls back to a quadratic membership scan.
+        
+        Time Complexity: O(n) (O(n²) for unhashable data)
+        Space Complexity: O(n)
+        """
+        values = self.to_list()
+        
+        try:
+            unique = list(dict.fromkeys(values))
+        except TypeError:
+            unique = []
+            for value in values:
+                if value not in unique:
+                    unique.append(value)
+        
+        self._rebuild(unique)
+    
+    def collapse_runs(self):
+        """
+        Remove adjacent duplicate elements from the list.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        values = self.to_list()
+        result = values[:1]
+        
+        for value in values[1:]:
+            if value != result[-1]:
+                result.append(value)
+        
+        self._rebuild(result)
+    
+    def find_middle(self):
+        """
+        Find the middle element of the list.
+        
+        Time Complexity: O(n / CHUNK_SIZE)
+        Space Complexity: O(1)
+        
+        Returns:
+            The data of the middle element, None if list is empty
+        """
+        if self.is_empty():
+            return None
+        
+        return self.get_element_at_position(self.size // 2)
+    
+    def to_list(self):
+        """
+        Convert the list to a Python list.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        
+        Returns:
+            list: A list containing all elements
+        """
+        result = []
+        chunk = self.head_chunk
+        
+        while chunk is not None:
+            result += chunk.data[:chunk.count]
+            chunk = chunk.next
+        
+        return result
+    
+    def __iter__(self):
+        """Iterate over the data stored in the list, chunk by chunk."""
+        chunk = self.head_chunk
+        while chunk is not None:
+            yield from chunk.data[:chunk.count]
+            chunk = chunk.next
+    
+    def __len__(self):
+        """Return the size of the list."""
+        return self.size
+    
+    def __str__(self):
+        """String representation of the list."""
+        return f"UnrolledLinkedList({self.to_list()})"
     
     def __repr__(self):
-        """Detailed string representation of the linked list."""
+        """Detailed string representation of the list."""
         return self.__str__()
 
 
@@ -423,8 +1066,16 @@ def merge_sorted_lists(list1, list2):
     """
     Merge two sorted linked lists into one sorted list.
     
+    The existing nodes are spliced together behind a dummy head, so no data
+    is copied and no nodes are allocated. Both input lists are consumed:
+    their nodes move into the merged list and they are left empty.
+    
+    If the same list is passed twice, its values are first copied into a
+    second list (splicing a list into itself would create a cycle); the
+    original list is still consumed.
+    
     Time Complexity: O(n + m) where n and m are the sizes of the lists
-    Space Complexity: O(1)
+    Space Complexity: O(1) (O(n) when both arguments are the same list)
     
     Args:
         list1: First sorted linked list
@@ -433,27 +1084,42 @@ def merge_sorted_lists(list1, list2):
     Returns:
         LinkedList: A new merged sorted linked list
     """
-    merged_list = LinkedList()
+    if list1 is list2:
+        list2 = LinkedList()
+        for value in list1:
+            list2.insert_at_end(value)
+    
+    dummy = Node(None)
+    tail = dummy
     current1 = list1.head
     current2 = list2.head
     
     while current1 is not None and current2 is not None:
         if current1.data <= current2.data:
-            merged_list.insert_at_end(current1.data)
+            tail.next = current1
             current1 = current1.next
         else:
-            merged_list.insert_at_end(current2.data)
+            tail.next = current2
             current2 = current2.next
+        tail = tail.next
     
-    # Add remaining elements from list1
-    while current1 is not None:
-        merged_list.insert_at_end(current1.data)
-        current1 = current1.next
+    # Link whatever is left from the list that did not run out
+    if current1 is not None:
+        tail.next = current1
+        tail = list1.tail
+    elif current2 is not None:
+        tail.next = current2
+        tail = list2.tail
     
-    # Add remaining elements from list2
-    while current2 is not None:
-        merged_list.insert_at_end(current2.data)
-        current2 = current2.next
+    merged_list = LinkedList()
+    merged_list.head = dummy.next
+    merged_list.tail = tail if tail is not dummy else None
+    merged_list.size = list1.size + list2.size
+    
+    for source in (list1, list2):
+        source.head = None
+        source.tail = None
+        source.size = 0
     
     return merged_list
 
@@ -535,6 +1201,15 @@ def main():
     merged = merge_sorted_lists(list1, list2)
     print("Merged list:")
     merged.display()
+    
+    # Unrolled linked list
+    print("\n9. Unrolled linked list...")
+    unrolled = UnrolledLinkedList()
+    for value in range(200, 0, -1):
+        unrolled.insert_at_end(value)
+    unrolled.sort()
+    print(f"Size: {unrolled.get_size()}, middle element: {unrolled.find_middle()}")
+    print(f"Element at position 150: {unrolled.get_element_at_position(150)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,619 @@
+# cython: language_level=3
+"""
+Linked List Implementation in Cython
+
+A compiled version of the core of linked_list.py. It mirrors Node.data and
+Node.next (there is no hop attribute), the LinkedList methods and
+attributes, and merge_sorted_lists; UnrolledLinkedList is not included.
+Nodes are C extension types, so traversals compile down to plain C loops
+over next pointers instead of interpreted attribute lookups.
+
+Build it in place with:
+
+    pip install cython
+    cythonize -i linked_list_c.pyx
+
+Author: Daniel Omoregie
+Date: 2024
+"""
+
+cimport cython
+
+
+@cython.freelist(1024)
+cdef class Node:
+    """
+    A node in the linked list.
+
+    Attributes:
+        data: The data stored in the node
+        next: Reference to the next node in the list
+    """
+
+    cdef public object data
+    cdef public Node next
+
+    def __init__(self, data):
+        """
+        Initialize a new node.
+
+        Args:
+            data: The data to store in the node
+        """
+        self.data = data
+        self.next = None
+
+    def __repr__(self):
+        """String representation of the node."""
+        return f"Node({self.data})"
+
+
+cdef Node _merge(Node a, Node b):
+    """Merge two sorted chains of nodes by relinking their next pointers."""
+    cdef Node dummy = Node(None)
+    cdef Node tail = dummy
+
+    while a is not None and b is not None:
+        if b.data < a.data:
+            tail.next = b
+            b = b.next
+        else:
+            tail.next = a
+            a = a.next
+        tail = tail.next
+
+    tail.next = a if a is not None else b
+    return dummy.next
+
+
+cdef Node _mergesort(Node head):
+    """Sort a chain of nodes with bottom-up merge sort."""
+    cdef list stack = []
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t bits
+    cdef Node node
+
+    while head is not None:
+        node = head
+        head = head.next
+        node.next = None
+
+        bits = count
+        while bits & 1:
+            node = _merge(stack.pop(), node)
+            bits >>= 1
+        stack.append(node)
+        count += 1
+
+    # Drain the stack, merging older (earlier) runs in front of newer ones
+    node = stack.pop() if stack else None
+    while stack:
+        node = _merge(stack.pop(), node)
+
+    return node
+
+
+cdef class LinkedList:
+    """
+    A singly linked list implementation.
+
+    This class provides methods for common linked list operations including
+    insertion, deletion, searching, and traversal.
+    """
+
+    cdef public Node head
+    cdef public Node tail
+    cdef public Py_ssize_t size
+
+    def __init__(self):
+        """
+        Initialize an empty linked list.
+
+        Attributes:
+            head: Reference to the first node in the list
+            tail: Reference to the last node in the list
+            size: Number of nodes in the list
+        """
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    cpdef bint is_empty(self):
+        """
+        Check if the linked list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise
+        """
+        return self.head is None
+
+    cpdef Py_ssize_t get_size(self):
+        """
+        Get the number of nodes in the linked list.
+
+        Returns:
+            int: The size of the linked list
+        """
+        return self.size
+
+    cpdef insert_at_beginning(self, data):
+        """
+        Insert a new node at the beginning of the linked list.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Args:
+            data: The data to insert
+        """
+        cdef Node new_node = Node(data)
+        new_node.next = self.head
+        self.head = new_node
+
+        if self.tail is None:
+            self.tail = new_node
+
+        self.size += 1
+
+    cpdef insert_at_end(self, data):
+        """
+        Insert a new node at the end of the linked list.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Args:
+            data: The data to insert
+        """
+        cdef Node new_node = Node(data)
+
+        if self.head is None:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+
+        self.tail = new_node
+        self.size += 1
+
+    cpdef insert_at_position(self, data, Py_ssize_t position):
+        """
+        Insert a new node at a specific position in the linked list.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+
+        Args:
+            data: The data to insert
+            position: The position where to insert (0-indexed)
+
+        Raises:
+            IndexError: If position is out of range
+        """
+        cdef Node new_node
+        cdef Node current
+
+        if position < 0 or position > self.size:
+            raise IndexError("Position out of range")
+
+        if position == 0:
+            self.insert_at_beginning(data)
+            return
+
+        if position == self.size:
+            self.insert_at_end(data)
+            return
+
+        new_node = Node(data)
+        current = self.head
+
+        # Move to the position before the insertion point
+        for _ in range(position - 1):
+            current = current.next
+
+        new_node.next = current.next
+        current.next = new_node
+        self.size += 1
+
+    cpdef bint delete_by_value(self, data):
+        """
+        Delete the first occurrence of a node with the given data.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+
+        Args:
+            data: The data to delete
+
+        Returns:
+            bool: True if the node was deleted, False if not found
+        """
+        cdef Node current
+
+        if self.head is None:
+            return False
+
+        # If the node to delete is the head
+        if self.head.data == data:
+            self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self.size -= 1
+            return True
+
+        current = self.head
+        while current.next is not None:
+            if current.next.data == data:
+                if current.next is self.tail:
+                    self.tail = current
+                current.next = current.next.next
+                self.size -= 1
+                return True
+            current = current.next
+
+        return False
+
+    cpdef delete_by_position(self, Py_ssize_t position):
+        """
+        Delete a node at a specific position.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+
+        Args:
+            position: The position of the node to delete (0-indexed)
+
+        Returns:
+            The data of the deleted node
+
+        Raises:
+            IndexError: If position is out of range
+        """
+        cdef Node current
+        cdef Node removed
+
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of range")
+
+        if position == 0:
+            removed = self.head
+            self.head = removed.next
+            if self.head is None:
+                self.tail = None
+        else:
+            current = self.head
+            for _ in range(position - 1):
+                current = current.next
+
+            removed = current.next
+            if removed is self.tail:
+                self.tail = current
+            current.next = removed.next
+
+        self.size -= 1
+        return removed.data
+
+    cpdef Py_ssize_t search(self, data):
+        """
+        Search for a node with the given data.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+
+        Args:
+            data: The data to search for
+
+        Returns:
+            int: The position of the node (0-indexed), -1 if not found
+        """
+        cdef Node current = self.head
+        cdef Py_ssize_t position = 0
+
+        while current is not None:
+            if current.data == data:
+                return position
+            current = current.next
+            position += 1
+
+        return -1
+
+    cpdef get_element_at_position(self, Py_ssize_t position):
+        """
+        Get the data at a specific position.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+
+        Args:
+            position: The position to get data from (0-indexed)
+
+        Returns:
+            The data at the specified position
+
+        Raises:
+            IndexError: If position is out of range
+        """
+        cdef Node current
+
+        if position < 0 or position >= self.size:
+            raise IndexError("Position out of range")
+
+        current = self.head
+        for _ in range(position):
+            current = current.next
+
+        return current.data
+
+    def display(self):
+        """
+        Display all elements in the linked list.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        if self.head is None:
+            print("List is empty")
+            return
+
+        print(" -> ".join(map(str, self.to_list())) + " -> None")
+
+    cpdef reverse(self):
+        """
+        Reverse the linked list in place.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        cdef Node previous = None
+        cdef Node current = self.head
+        cdef Node next_node
+
+        self.tail = current
+
+        while current is not None:
+            next_node = current.next
+            current.next = previous
+            previous = current
+            current = next_node
+
+        self.head = previous
+
+    cpdef sort(self):
+        """
+        Sort the linked list using bottom-up merge sort.
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(log n)
+        """
+        cdef Node current
+
+        if self.head is None or self.head.next is None:
+            return
+
+        self.head = _mergesort(self.head)
+
+        # Relinking moves the last node, so find the new tail
+        current = self.head
+        while current.next is not None:
+            current = current.next
+        self.tail = current
+
+    cpdef remove_duplicates(self):
+        """
+        Remove duplicate elements, keeping the first occurrence of each value.
+
+        Values already seen are tracked in a set. Unhashable data falls back
+        to comparing every node against the nodes after it.
+
+        Time Complexity: O(n) (O(n²) for unhashable data)
+        Space Complexity: O(u) where u is the number of unique elements
+        """
+        cdef set seen = set()
+        cdef Node previous = None
+        cdef Node current = self.head
+        cdef Node runner
+
+        try:
+            while current is not None:
+                if current.data in seen:
+                    previous.next = current.next
+                    self.size -= 1
+                else:
+                    seen.add(current.data)
+                    previous = current
+                current = current.next
+            self.tail = previous
+            return
+        except TypeError:
+            pass
+
+        # Unhashable data: only true duplicates were removed so far, so a
+        # quadratic scan can finish the job from the current state
+        current = self.head
+        while current is not None:
+            runner = current
+            while runner.next is not None:
+                if runner.next.data == current.data:
+                    runner.next = runner.next.next
+                    self.size -= 1
+                else:
+                    runner = runner.next
+
+            self.tail = current
+            current = current.next
+
+    cpdef collapse_runs(self):
+        """
+        Remove adjacent duplicate elements, collapsing each run of equal
+        values into a single node.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        cdef Node current
+
+        if self.head is None or self.head.next is None:
+            return
+
+        current = self.head
+        while current.next is not None:
+            if current.data == current.next.data:
+                current.next = current.next.next
+                self.size -= 1
+            else:
+                current = current.next
+
+        self.tail = current
+
+    cpdef find_middle(self):
+        """
+        Find the middle element of the linked list.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+
+        Returns:
+            The data of the middle element, None if list is empty
+        """
+        cdef Node slow
+        cdef Node fast
+
+        if self.head is None:
+            return None
+
+        slow = self.head
+        fast = self.head
+
+        while fast is not None and fast.next is not None:
+            slow = slow.next
+            fast = fast.next.next
+
+        return slow.data
+
+    cpdef bint detect_loop(self):
+        """
+        Detect if there's a loop in the linked list using Floyd's algorithm.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+
+        Returns:
+            bool: True if loop is detected, False otherwise
+        """
+        cdef Node slow
+        cdef Node fast
+
+        if self.head is None or self.head.next is None:
+            return False
+
+        slow = self.head
+        fast = self.head
+
+        while fast is not None and fast.next is not None:
+            slow = slow.next
+            fast = fast.next.next
+
+            if slow is fast:
+                return True
+
+        return False
+
+    cpdef list to_list(self):
+        """
+        Convert the linked list to a Python list.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+
+        Returns:
+            list: A list containing all elements
+        """
+        cdef list result = []
+        cdef Node current = self.head
+
+        while current is not None:
+            result.append(current.data)
+            current = current.next
+
+        return result
+
+    def __iter__(self):
+        """Iterate over the data stored in the linked list, head first."""
+        cdef Node current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    def __len__(self):
+        """Return the size of the linked list."""
+        return self.size
+
+    def __str__(self):
+        """String representation of the linked list."""
+        return f"LinkedList({self.to_list()})"
+
+    def __repr__(self):
+        """Detailed string representation of the linked list."""
+        return self.__str__()
+
+
+def merge_sorted_lists(LinkedList list1 not None, LinkedList list2 not None):
+    """
+    Merge two sorted linked lists into one sorted list.
+
+    The existing nodes are spliced together behind a dummy head, so no data
+    is copied and no nodes are allocated. Both input lists are consumed:
+    their nodes move into the merged list and they are left empty.
+
+    If the same list is passed twice, its values are first copied into a
+    second list (splicing a list into itself would create a cycle); the
+    original list is still consumed.
+
+    Time Complexity: O(n + m) where n and m are the sizes of the lists
+    Space Complexity: O(1) (O(n) when both arguments are the same list)
+
+    Args:
+        list1: First sorted linked list
+        list2: Second sorted linked list
+
+    Returns:
+        LinkedList: A new merged sorted linked list
+    """
+    cdef Node dummy = Node(None)
+    cdef Node tail = dummy
+    cdef Node current1 = list1.head
+    cdef Node current2 = list2.head
+    cdef LinkedList merged_list = LinkedList()
+
+    if list1 is list2:
+        list2 = LinkedList()
+        for value in list1:
+            list2.insert_at_end(value)
+        current2 = list2.head
+
+    while current1 is not None and current2 is not None:
+        if current1.data <= current2.data:
+            tail.next = current1
+            current1 = current1.next
+        else:
+            tail.next = current2
+            current2 = current2.next
+        tail = tail.next
+
+    # Link whatever is left from the list that did not run out
+    if current1 is not None:
+        tail.next = current1
+        tail = list1.tail
+    elif current2 is not None:
+        tail.next = current2
+        tail = list2.tail
+
+    merged_list.head = dummy.next
+    merged_list.tail = tail if tail is not dummy else None
+    merged_list.size = list1.size + list2.size
+
+    list1.head = list1.tail = None
+    list1.size = 0
+    list2.head = list2.tail = None
+    list2.size = 0
+
+    return merged_list
@@ -11,10 +11,20 @@ Date: 2024
 
 import time
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import statistics
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 
 class ScalingAction(Enum):
@@ -24,7 +34,7 @@ class ScalingAction(Enum):
     NO_ACTION = "no_action"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SystemMetrics:
     """Data class for system metrics."""
     cpu_usage: float
@@ -36,7 +46,7 @@ class SystemMetrics:
     timestamp: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScalingConfig:
     """Configuration for auto-scaling behavior."""
     min_instances: int = 2
@@ -47,6 +57,92 @@ class ScalingConfig:
     metrics_window: int = 60  # seconds
     scale_up_factor: float = 1.5
     scale_down_factor: float = 0.7
+    sample_rate: float = 1.0  # expected metrics samples per second
+    
+    def __post_init__(self):
+        if not self.sample_rate > 0:
+            raise ValueError(f"sample_rate must be positive, got {self.sample_rate}")
+
+
+# Row order of the metric columns in AutoScaler's ring buffer
+METRIC_FIELDS = (
+    "cpu_usage",
+    "memory_usage",
+    "disk_usage",
+    "network_io",
+    "active_connections",
+    "response_time",
+)
+
+# Action codes returned by the _decide kernel, indexed into _ACTIONS
+_NO_ACTION = 0
+_SCALE_UP = 1
+_SCALE_DOWN = 2
+_ACTIONS = (ScalingAction.NO_ACTION, ScalingAction.SCALE_UP, ScalingAction.SCALE_DOWN)
+
+
+@njit(cache=True, fastmath=True)
+def _window_sums(window, start, count):
+    """
+    Sum every metric row of the ring buffer over the current window.
+    
+    Args:
+        window: Ring buffer with one row per metric field
+        start: Slot of the oldest sample
+        count: Number of samples in the window
+        
+    Returns:
+        Array with the sum of each metric row
+    """
+    rows, capacity = window.shape
+    sums = np.zeros(rows)
+    for row in range(rows):
+        total = 0.0
+        index = start
+        for _ in range(count):
+            total += window[row, index]
+            index += 1
+            if index == capacity:
+                index = 0
+        sums[row] = total
+    return sums
+
+
+@njit(cache=True)
+def _decide(cpu, memory, response, up_threshold, down_threshold,
+            can_scale_up, can_scale_down):
+    """
+    Choose a scaling action from averaged metrics.
+    
+    Scale up if any critical metric exceeds its threshold (1 second for
+    response time), scale down if all of them are below theirs (200ms for
+    response time). Confidence grows with how extreme the values are.
+    can_scale_up and can_scale_down say whether the instance limits allow
+    each direction at all. NaN metrics never satisfy a threshold, so they
+    lead to no action with a confidence of 0.0.
+    
+    Returns:
+        Tuple of (action code, confidence score between 0 and 1)
+    """
+    # The predicates are combined without short-circuiting and the results
+    # picked with selects, so the compiled kernel has no data-dependent
+    # jumps; scale-up wins if both directions would apply. fastmath is left
+    # off because it lets the compiler assume the inputs are never NaN.
+    up = (((cpu > up_threshold) | (memory > up_threshold) | (response > 1000.0))
+          & can_scale_up)
+    down = (((cpu < down_threshold) & (memory < down_threshold) & (response < 200.0))
+            & can_scale_down)
+    
+    up_confidence = min(min(cpu / 100.0, 1.0) * 0.4 +
+                        min(memory / 100.0, 1.0) * 0.4 +
+                        min(response / 2000.0, 1.0) * 0.2, 1.0)
+    down_confidence = min((1.0 - cpu / 100.0) * 0.4 +
+                          (1.0 - memory / 100.0) * 0.4 +
+                          (1.0 - response / 1000.0) * 0.2, 1.0)
+    
+    code = _SCALE_UP if up else (_SCALE_DOWN if down else _NO_ACTION)
+    confidence = up_confidence if up else (down_confidence if down else 0.0)
+    return code, confidence
 
 
 class AutoScaler:
@@ -66,10 +162,29 @@ class AutoScaler:
         """
         self.config = config
         self.current_instances = config.min_instances
-        self.metrics_history: List[SystemMetrics] = []
         self.last_scaling_time = 0
         self.logger = logging.getLogger(__name__)
         
+        # Read once here instead of through self.config on every sample
+        self._metrics_window = config.metrics_window
+        
+        # Metrics history is a ring buffer stored column-wise: one contiguous
+        # float32 row per metric field plus a float64 timestamp column.
+        capacity = max(128, int(config.metrics_window * config.sample_rate))
+        self._window = np.empty((len(METRIC_FIELDS), capacity), dtype=np.float32)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._tail = 0  # slot of the oldest sample
+        self._count = 0  # number of samples in the window
+        
+        # Running per-metric sums over the window, updated as samples are
+        # added and evicted so averages never rescan the buffer
+        self._sums = np.zeros(len(METRIC_FIELDS), dtype=np.float64)
+        self._evictions = 0  # evictions since the sums were last recomputed
+        
+        # Compile the kernels now rather than on the first scaling decision
+        _window_sums(self._window, 0, 0)
+        _decide(0.0, 0.0, 0.0, 0.0, 0.0, False, False)
+        
     def add_metrics(self, metrics: SystemMetrics) -> None:
         """
         Add new metrics to the history.
@@ -77,14 +192,107 @@ class AutoScaler:
         Args:
             metrics: System metrics to add
         """
-        self.metrics_history.append(metrics)
-        
-        # Keep only metrics within the window
-        cutoff_time = time.time() - self.config.metrics_window
-        self.metrics_history = [
-            m for m in self.metrics_history 
-            if m.timestamp >= cutoff_time
-        ]
+        capacity = self._timestamps.shape[0]
+        if self._count == capacity:
+            self._grow_window()
+            capacity = self._timestamps.shape[0]
+        
+        window = self._window
+        head = (self._tail + self._count) % capacity
+        window[:, head] = (
+            metrics.cpu_usage,
+            metrics.memory_usage,
+            metrics.disk_usage,
+            metrics.network_io,
+            metrics.active_connections,
+            metrics.response_time,
+        )
+        self._timestamps[head] = metrics.timestamp
+        self._sums += window[:, head]
+        self._count += 1
+        
+        self._evict_stale()
+    
+    def add_metrics_batch(self, values: np.ndarray, timestamps: np.ndarray) -> None:
+        """
+        Add a batch of metrics samples to the history at once.
+        
+        Args:
+            values: Array of shape (len(METRIC_FIELDS), n) with one row per
+                metric field, as returned by MetricsCollector.collect_batch
+            timestamps: Array of the n sample timestamps in time order
+        """
+        values = np.asarray(values, dtype=np.float32)
+        n = values.shape[1]
+        while self._count + n > self._timestamps.shape[0]:
+            self._grow_window()
+        
+        # Copy the batch in with at most two slice assignments (the second
+        # one only when the batch wraps around the end of the buffer)
+        capacity = self._timestamps.shape[0]
+        head = (self._tail + self._count) % capacity
+        first = min(n, capacity - head)
+        self._window[:, head:head + first] = values[:, :first]
+        self._timestamps[head:head + first] = timestamps[:first]
+        self._window[:, :n - first] = values[:, first:]
+        self._timestamps[:n - first] = timestamps[first:]
+        
+        self._sums += values.sum(axis=1, dtype=np.float64)
+        self._count += n
+        
+        self._evict_stale()
+    
+    def _evict_stale(self) -> None:
+        """
+        Drop samples that have fallen out of the metrics window.
+        
+        Samples arrive in time order, so stale ones always form a prefix of
+        the window starting at the tail. The common case of nothing to evict
+        costs a single comparison; otherwise the cutoff is found by binary
+        search over the (at most two) time-ordered buffer segments and the
+        stale block is removed from the running sums in one vectorized step.
+        """
+        timestamps = self._timestamps
+        tail = self._tail
+        count = self._count
+        cutoff_time = time.time() - self._metrics_window
+        if not count or timestamps[tail] >= cutoff_time:
+            return
+        
+        window = self._window
+        capacity = timestamps.shape[0]
+        end = min(tail + count, capacity)
+        stale = int(np.searchsorted(timestamps[tail:end], cutoff_time))
+        self._sums -= window[:, tail:tail + stale].sum(axis=1, dtype=np.float64)
+        
+        if tail + stale == capacity and count > stale:
+            # The whole first segment was stale; continue in the wrapped part
+            wrapped = int(np.searchsorted(timestamps[:count - stale], cutoff_time))
+            self._sums -= window[:, :wrapped].sum(axis=1, dtype=np.float64)
+            stale += wrapped
+        
+        self._tail = (tail + stale) % capacity
+        self._count = count - stale
+        self._evictions += stale
+        
+        # Recompute the sums once per buffer cycle so rounding errors from
+        # repeated add/subtract cannot accumulate
+        if self._evictions >= capacity:
+            self._sums = _window_sums(window, self._tail, self._count)
+            self._evictions = 0
+    
+    def _grow_window(self) -> None:
+        """Double the ring buffer capacity, unrolling it to start at slot 0."""
+        capacity = self._timestamps.shape[0]
+        window = np.empty((len(METRIC_FIELDS), capacity * 2), dtype=np.float32)
+        timestamps = np.empty(capacity * 2, dtype=np.float64)
+        
+        window[:, :capacity] = np.roll(self._window, -self._tail, axis=1)
+        timestamps[:capacity] = np.roll(self._timestamps, -self._tail)
+        
+        self._window = window
+        self._timestamps = timestamps
+        self._tail = 0
     
     def should_scale(self) -> Tuple[ScalingAction, float]:
         """
@@ -93,112 +301,65 @@ class AutoScaler:
         Returns:
             Tuple of (scaling action, confidence score)
         """
-        if len(self.metrics_history) < 5:
+        if self._count < 5:
             return ScalingAction.NO_ACTION, 0.0
         
+        now = time.time()
+        cfg = self.config
+        
         # Check cooldown period
-        if time.time() - self.last_scaling_time < self.config.cooldown_period:
+        if now - self.last_scaling_time < cfg.cooldown_period:
+            return ScalingAction.NO_ACTION, 0.0
+        
+        # Skip the averaging entirely when the instance limits rule out both
+        # directions
+        can_scale_up = self.current_instances < cfg.max_instances
+        can_scale_down = self.current_instances > cfg.min_instances
+        if not (can_scale_up or can_scale_down):
             return ScalingAction.NO_ACTION, 0.0
         
         # Calculate average metrics over the window
-        avg_metrics = self._calculate_average_metrics()
+        avg_metrics = self._calculate_average_metrics(now)
         
         # Determine scaling action based on thresholds
-        if self._should_scale_up(avg_metrics):
-            confidence = self._calculate_scale_up_confidence(avg_metrics)
-            return ScalingAction.SCALE_UP, confidence
-        elif self._should_scale_down(avg_metrics):
-            confidence = self._calculate_scale_down_confidence(avg_metrics)
-            return ScalingAction.SCALE_DOWN, confidence
-        else:
-            return ScalingAction.NO_ACTION, 0.0
-    
-    def _calculate_average_metrics(self) -> SystemMetrics:
-        """Calculate average metrics over the configured window."""
-        if not self.metrics_history:
-            return SystemMetrics(0, 0, 0, 0, 0, 0, time.time())
-        
-        return SystemMetrics(
-            cpu_usage=statistics.mean([m.cpu_usage for m in self.metrics_history]),
-            memory_usage=statistics.mean([m.memory_usage for m in self.metrics_history]),
-            disk_usage=statistics.mean([m.disk_usage for m in self.metrics_history]),
-            network_io=statistics.mean([m.network_io for m in self.metrics_history]),
-            active_connections=statistics.mean([m.active_connections for m in self.metrics_history]),
-            response_time=statistics.mean([m.response_time for m in self.metrics_history]),
-            timestamp=time.time()
+        code, confidence = _decide(
+            avg_metrics.cpu_usage,
+            avg_metrics.memory_usage,
+            avg_metrics.response_time,
+            float(cfg.scale_up_threshold),
+            float(cfg.scale_down_threshold),
+            can_scale_up,
+            can_scale_down,
         )
+        return _ACTIONS[code], confidence
     
-    def _should_scale_up(self, metrics: SystemMetrics) -> bool:
+    def _calculate_average_metrics(self, now: Optional[float] = None) -> SystemMetrics:
         """
-        Determine if we should scale up.
+        Calculate average metrics over the configured window.
         
-        Args:
-            metrics: Average system metrics
-            
-        Returns:
-            True if should scale up
-        """
-        # Scale up if any critical metric exceeds threshold
-        return (
-            metrics.cpu_usage > self.config.scale_up_threshold or
-            metrics.memory_usage > self.config.scale_up_threshold or
-            metrics.response_time > 1000  # 1 second threshold
-        ) and self.current_instances < self.config.max_instances
-    
-    def _should_scale_down(self, metrics: SystemMetrics) -> bool:
-        """
-        Determine if we should scale down.
+        The running sums are kept up to date by add_metrics, so this is
+        O(1) regardless of the window size.
         
         Args:
-            metrics: Average system metrics
-            
-        Returns:
-            True if should scale down
-        """
-        # Scale down if all metrics are below threshold
-        return (
-            metrics.cpu_usage < self.config.scale_down_threshold and
-            metrics.memory_usage < self.config.scale_down_threshold and
-            metrics.response_time < 200  # 200ms threshold
-        ) and self.current_instances > self.config.min_instances
-    
-    def _calculate_scale_up_confidence(self, metrics: SystemMetrics) -> float:
+            now: Timestamp for the result; defaults to the current time
         """
-        Calculate confidence score for scale-up decision.
+        if now is None:
+            now = time.time()
         
-        Args:
-            metrics: Average system metrics
-            
-        Returns:
-            Confidence score between 0 and 1
-        """
-        # Higher confidence for more extreme values
-        cpu_factor = min(metrics.cpu_usage / 100, 1.0)
-        memory_factor = min(metrics.memory_usage / 100, 1.0)
-        response_factor = min(metrics.response_time / 2000, 1.0)
-        
-        # Weighted average of factors
-        confidence = (cpu_factor * 0.4 + memory_factor * 0.4 + response_factor * 0.2)
-        return min(confidence, 1.0)
-    
-    def _calculate_scale_down_confidence(self, metrics: SystemMetrics) -> float:
-        """
-        Calculate confidence score for scale-down decision.
+        if not self._count:
+            return SystemMetrics(0, 0, 0, 0, 0, 0, now)
         
-        Args:
-            metrics: Average system metrics
-            
-        Returns:
-            Confidence score between 0 and 1
-        """
-        # Higher confidence for lower values
-        cpu_factor = 1.0 - (metrics.cpu_usage / 100)
-        memory_factor = 1.0 - (metrics.memory_usage / 100)
-        response_factor = 1.0 - (metrics.response_time / 1000)
-        
-        # Weighted average of factors
-        confidence = (cpu_factor * 0.4 + memory_factor * 0.4 + response_factor * 0.2)
-        return min(confidence, 1.0)
+        means = self._sums / self._count
+        
+        return SystemMetrics(
+            cpu_usage=float(means[0]),
+            memory_usage=float(means[1]),
+            disk_usage=float(means[2]),
+            network_io=float(means[3]),
+            active_connections=float(means[4]),
+            response_time=float(means[5]),
+            timestamp=now
+        )
     
     def execute_scaling(self, action: ScalingAction, confidence: float) -> bool:
         """
@@ -280,7 +441,7 @@ class AutoScaler:
             "current_instances": self.current_instances,
             "min_instances": self.config.min_instances,
             "max_instances": self.config.max_instances,
-            "metrics_count": len(self.metrics_history),
+            "metrics_count": self._count,
             "last_scaling_time": self.last_scaling_time,
             "time_since_last_scaling": time.time() - self.last_scaling_time
         }
@@ -294,9 +455,22 @@ class MetricsCollector:
     like Prometheus, CloudWatch, or custom monitoring solutions.
     """
     
-    def __init__(self):
-        """Initialize the metrics collector."""
+    def __init__(self, sample_rate: float = 1.0):
+        """
+        Initialize the metrics collector.
+        
+        Args:
+            sample_rate: Samples per second that collect_batch simulates
+            
+        Raises:
+            ValueError: If sample_rate is not positive
+        """
+        if not sample_rate > 0:
+            raise ValueError(f"sample_rate must be positive, got {sample_rate}")
+        
         self.logger = logging.getLogger(__name__)
+        self.sample_rate = sample_rate
+        self._rng = np.random.default_rng()
     
     def collect_metrics(self) -> SystemMetrics:
         """
@@ -322,6 +496,36 @@ class MetricsCollector:
             response_time=random.uniform(100, 800),
             timestamp=time.time()
         )
+    
+    def collect_batch(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Collect n system metrics samples at once.
+        
+        Each metric is drawn as a whole array in a single call, laid out the
+        same way as AutoScaler's ring buffer so the result can be passed
+        straight to AutoScaler.add_metrics_batch.
+        
+        Args:
+            n: Number of samples to collect
+            
+        Returns:
+            Tuple of (values with one float32 row per field in
+            METRIC_FIELDS order, timestamps). The timestamps are spaced
+            1 / sample_rate seconds apart and end at the current time, as
+            if the samples had been collected one by one.
+        """
+        # Simulated metrics for demonstration, same ranges as collect_metrics
+        rng = self._rng
+        values = np.empty((len(METRIC_FIELDS), n), dtype=np.float32)
+        values[0] = rng.uniform(20, 90, n)
+        values[1] = rng.uniform(30, 80, n)
+        values[2] = rng.uniform(40, 70, n)
+        values[3] = rng.uniform(10, 100, n)
+        values[4] = rng.integers(50, 500, n, endpoint=True)
+        values[5] = rng.uniform(100, 800, n)
+        
+        timestamps = time.time() - np.arange(n)[::-1] / self.sample_rate
+        return values, timestamps
 
 
 def main():